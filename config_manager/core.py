@@ -315,6 +315,11 @@ class ConfigManager:
         Returns the complete configuration with environment-specific
         values resolved and merged.
         
+        The result is not a deep copy: sections the environment does not
+        override are the same dict objects as in config_data, and the cached
+        result is returned on later calls. Treat it as read-only, or
+        deep-copy it before modifying nested values.
+        
         Args:
             use_cache: Whether to use cached result
             
@@ -339,12 +344,15 @@ class ConfigManager:
         
         return resolved
     
-    def validate(self, raise_on_error: bool = False) -> List[str]:
+    def validate(self, raise_on_error: bool = False,
+                 fail_fast: Optional[bool] = None) -> List[str]:
         """
         Validate the current configuration.
         
         Args:
             raise_on_error: Whether to raise exception on validation errors
+            fail_fast: Stop checking a key after its first failing rule
+                (defaults to raise_on_error)
             
         Returns:
             List of validation error messages
@@ -353,7 +361,7 @@ class ConfigManager:
             ConfigValidationError: If raise_on_error=True and validation fails
         """
         resolved_config = self.get_resolved_config()
-        return self.validator.validate(resolved_config, raise_on_error)
+        return self.validator.validate(resolved_config, raise_on_error, fail_fast)
     
     def add_validation_rule(self, key_path: str, 
                            rule: Union[ValidationRule, str], 
@@ -391,6 +399,11 @@ class ConfigManager:
         """
         Get configuration as dictionary.
         
+        The top-level dictionary is a new copy, but nested dictionaries and
+        other values are shared with the manager's data (see
+        get_resolved_config). Deep-copy the result before modifying nested
+        values.
+        
         Args:
             resolved: Whether to return resolved configuration
             
@@ -450,9 +463,13 @@ class ConfigManager:
         self.loaded_files = []
         self._resolved_cache = None
         
-        # Reload all files
+        # Reload all files, bypassing the loaders' parse caches so the
+        # files really are re-read from disk
         for file_path in files_to_reload:
             if file_path.exists():
+                loader = self.loaders.get(file_path.suffix.lower())
+                if loader is not None:
+                    loader.invalidate(file_path)
                 self.load_file(file_path)
         
         return self
@@ -6,9 +6,10 @@ environment variable overrides.
 """
 
 import os
+import string
 from enum import Enum
+from types import MappingProxyType
 from typing import Optional, Dict, Any, Union
-from .utils import set_nested_value
 
 
 class Environment(Enum):
@@ -35,45 +36,69 @@ class Environment(Enum):
         Raises:
             ValueError: If environment string is not recognized
         """
-        env_map = {
-            # Development aliases
-            'dev': cls.DEVELOPMENT,
-            'develop': cls.DEVELOPMENT, 
-            'development': cls.DEVELOPMENT,
-            'local': cls.DEVELOPMENT,
-            
-            # Staging aliases
-            'stage': cls.STAGING,
-            'staging': cls.STAGING,
-            'preprod': cls.STAGING,
-            'pre-production': cls.STAGING,
-            
-            # Production aliases
-            'prod': cls.PRODUCTION,
-            'production': cls.PRODUCTION,
-            'live': cls.PRODUCTION,
-            
-            # Testing aliases  
-            'test': cls.TESTING,
-            'testing': cls.TESTING,
-            'ci': cls.TESTING,
-        }
-        
-        normalized_env = env_str.lower().strip()
-        if normalized_env in env_map:
-            return env_map[normalized_env]
-        
-        # Try direct enum value match
         try:
-            return cls(normalized_env)
+            return cls._from_normalized(env_str.lower().strip())
         except ValueError:
             raise ValueError(f"Unknown environment: {env_str}. "
-                           f"Supported values: {list(env_map.keys())}")
+                           f"Supported values: {list(_ALIAS_MAP.keys())}") from None
+    
+    @classmethod
+    def _from_normalized(cls, normalized_env: str) -> 'Environment':
+        """
+        Resolve an environment string that is already stripped and lowercased.
+        
+        Skips the normalization done by from_string for callers that
+        hold pre-normalized keys.
+        
+        Raises:
+            ValueError: If environment string is not recognized
+        """
+        try:
+            # The alias map covers every enum value as well
+            return _ALIAS_MAP[normalized_env]
+        except KeyError:
+            raise ValueError(f"Unknown environment: {normalized_env}. "
+                           f"Supported values: {list(_ALIAS_MAP.keys())}") from None
     
     def __str__(self) -> str:
         return self.value
 
 
+# Read-only lookup tables, built once at import time
+_ALIAS_MAP = MappingProxyType({
+    # Development aliases
+    'dev': Environment.DEVELOPMENT,
+    'develop': Environment.DEVELOPMENT,
+    'development': Environment.DEVELOPMENT,
+    'local': Environment.DEVELOPMENT,
+    
+    # Staging aliases
+    'stage': Environment.STAGING,
+    'staging': Environment.STAGING,
+    'preprod': Environment.STAGING,
+    'pre-production': Environment.STAGING,
+    
+    # Production aliases
+    'prod': Environment.PRODUCTION,
+    'production': Environment.PRODUCTION,
+    'live': Environment.PRODUCTION,
+    
+    # Testing aliases
+    'test': Environment.TESTING,
+    'testing': Environment.TESTING,
+    'ci': Environment.TESTING,
+})
+
+_BOOL_MAP = MappingProxyType({
+    'true': True, 'yes': True, '1': True, 'on': True, 'enabled': True,
+    'false': False, 'no': False, '0': False, 'off': False, 'disabled': False,
+})
+
+# Lowercases and maps '_' to '.' in one pass; env var names are ASCII (POSIX)
+_ENV_KEY_TABLE = str.maketrans(string.ascii_uppercase + '_',
+                               string.ascii_lowercase + '.')
+
+
 class EnvironmentManager:
     """
     Manager for environment-specific configurations and variable overrides.
@@ -94,7 +119,9 @@ class EnvironmentManager:
         self.env_var_name = env_var_name
         self._current_env: Optional[Environment] = None
         self._env_overrides_cache: Optional[Dict[str, Any]] = None
-    
+        # Cached "<env>." prefix used by get_environment_config_key
+        self._env_key_prefix: Optional[str] = None
+
     @property
     def current_environment(self) -> Environment:
         """
@@ -108,15 +135,22 @@ class EnvironmentManager:
         Returns:
             Current environment
         """
-        if self._current_env is None:
+        environment = self._current_env
+        if environment is None:
             env_str = os.getenv(self.env_var_name, 'development')
             try:
-                self._current_env = Environment.from_string(env_str)
+                environment = Environment.from_string(env_str)
             except ValueError:
                 # Fallback to development if invalid environment
-                self._current_env = Environment.DEVELOPMENT
-        
-        return self._current_env
+                environment = Environment.DEVELOPMENT
+            self._set_current_env(environment)
+
+        return environment
+
+    def _set_current_env(self, environment: Environment) -> None:
+        """Store the current environment and precompute its key prefix."""
+        self._current_env = environment
+        self._env_key_prefix = environment.value + '.'
     
     def set_environment(self, environment: Union[str, Environment]) -> None:
         """
@@ -128,11 +162,12 @@ class EnvironmentManager:
         Raises:
             ValueError: If environment string is not recognized
         """
-        if isinstance(environment, str):
+        if not isinstance(environment, Environment):
             environment = Environment.from_string(environment)
         
-        self._current_env = environment
-        # Clear cache when environment changes
+        # The resolved value sticks; only the overrides cache is invalidated,
+        # so the next current_environment access does not re-read os.environ
+        self._set_current_env(environment)
         self._env_overrides_cache = None
     
     def get_env_overrides(self, prefix: str = 'CONFIG_', 
@@ -175,17 +210,33 @@ class EnvironmentManager:
             return self._env_overrides_cache
         
         overrides = {}
-        
+        prefix_len = len(prefix)
+        first_char = prefix[:1]
+        convert = self._convert_env_value
+        # Bind once so the inner loop skips the attribute lookup
+        _setdefault = dict.setdefault
+
         for key, value in os.environ.items():
-            if key.startswith(prefix):
-                # Remove prefix and convert to config key format
-                config_key = key[len(prefix):].lower().replace('_', '.')
-                
-                # Convert the value to appropriate type
-                converted_value = self._convert_env_value(value)
-                
-                # Set nested value in overrides dict
-                set_nested_value(overrides, config_key, converted_value)
+            # Cheap length/first-character rejection before the full compare;
+            # most variables in a typical shell environment fail here
+            if prefix_len and (len(key) < prefix_len or key[0] != first_char):
+                continue
+            if not key.startswith(prefix):
+                continue
+
+            # Remove prefix and convert to config key segments
+            segments = key[prefix_len:].translate(_ENV_KEY_TABLE).split('.')
+
+            # Walk/create the nested dicts, replacing non-dict intermediates
+            node = overrides
+            for segment in segments[:-1]:
+                child = _setdefault(node, segment, {})
+                if not isinstance(child, dict):
+                    child = node[segment] = {}
+                node = child
+
+            # Convert the value to appropriate type
+            node[segments[-1]] = convert(value)
         
         if cache:
             self._env_overrides_cache = overrides
@@ -214,10 +265,8 @@ class EnvironmentManager:
         
         # Boolean values (case-insensitive)
         lower_value = value.lower()
-        if lower_value in ('true', 'yes', '1', 'on', 'enabled'):
-            return True
-        elif lower_value in ('false', 'no', '0', 'off', 'disabled'):
-            return False
+        if lower_value in _BOOL_MAP:
+            return _BOOL_MAP[lower_value]
         
         # Numeric values
         try:
@@ -247,7 +296,11 @@ class EnvironmentManager:
         Returns:
             Environment-prefixed key (e.g., 'production.database.host')
         """
-        return f"{self.current_environment.value}.{base_key}"
+        prefix = self._env_key_prefix
+        if prefix is None:
+            # First use: resolving the environment also caches its prefix
+            prefix = self.current_environment.value + '.'
+        return prefix + base_key
     
     def is_development(self) -> bool:
         """Check if current environment is development."""
@@ -4,8 +4,11 @@ Base loader interface for configuration file formats.
 This module provides the abstract base class that all configuration loaders must implement.
 """
 
+import os
+from copy import deepcopy
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Union, List
+from functools import cached_property, lru_cache
+from typing import Dict, Any, Union, List, FrozenSet, Tuple, Callable, Optional
 from pathlib import Path
 
 
@@ -70,5 +73,81 @@ class BaseLoader(ABC):
         Returns:
             True if the file extension is supported, False otherwise
         """
-        file_path = Path(file_path)
-        return file_path.suffix.lower() in self.supported_extensions
\ No newline at end of file
+        return self._extension(file_path) in self._extension_set
+    
+    @cached_property
+    def _extension_set(self) -> FrozenSet[str]:
+        """Supported extensions as a frozenset, built once per loader."""
+        return frozenset(ext.lower() for ext in self.supported_extensions)
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _extension(file_path: Union[str, Path]) -> str:
+        """Return the lowercased extension of a path (memoized)."""
+        return os.path.splitext(file_path)[1].lower()
+    
+    @cached_property
+    def _load_cache(self) -> Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]]:
+        """Parsed results keyed by absolute path -> ((mtime_ns, size), data)."""
+        return {}
+    
+    def _load_cached(self, file_path: Path,
+                     parse: Callable[[bytes, Path], Dict[str, Any]],
+                     read_error: str) -> Dict[str, Any]:
+        """
+        Read and parse a file, reusing the last result if it is unchanged.
+        
+        A file counts as unchanged while its modification time and size
+        match the cached entry. Callers always get their own deep copy, so
+        mutating a loaded result never alters the cached parse. Use
+        invalidate() to force a re-read (e.g. after a same-size edit within
+        one mtime tick).
+        
+        Args:
+            file_path: Path to the configuration file
+            parse: Function turning the raw file bytes into a dictionary
+            read_error: Message prefix for other read failures
+                (e.g. "Error reading YAML file")
+            
+        Returns:
+            Dictionary containing the loaded configuration data
+            
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file cannot be read (directory, permissions)
+        """
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {file_path}")
+        except OSError as e:
+            raise ValueError(f"{read_error} {file_path}: {e}")
+        
+        cache_key = os.path.abspath(file_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        entry = self._load_cache.get(cache_key)
+        if entry is not None and entry[0] == signature:
+            return deepcopy(entry[1])
+        
+        try:
+            raw = file_path.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {file_path}")
+        except OSError as e:
+            raise ValueError(f"{read_error} {file_path}: {e}")
+        
+        data = parse(raw, file_path)
+        self._load_cache[cache_key] = (signature, data)
+        return deepcopy(data)
+    
+    def invalidate(self, file_path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Drop cached parse results.
+        
+        Args:
+            file_path: File to forget (None to clear the whole cache)
+        """
+        if file_path is None:
+            self._load_cache.clear()
+        else:
+            self._load_cache.pop(os.path.abspath(file_path), None)
@@ -2,6 +2,8 @@
 JSON configuration file loader.
 
 This module provides a loader for JSON configuration files using the standard json library.
+Decoding uses msgspec when the 'speedups' extra is installed, as it is
+considerably faster than the standard library parser.
 """
 
 import json
@@ -9,6 +11,19 @@ from pathlib import Path
 from typing import Dict, Any, Union, List
 from .base import BaseLoader
 
+# msgspec (the 'speedups' extra) when installed. Its grammar is stricter
+# than json's (e.g. NaN), so anything it rejects is retried with json.loads
+try:
+    import msgspec
+except ImportError:
+    _json_decode = json.loads
+else:
+    def _json_decode(raw: bytes) -> Any:
+        try:
+            return msgspec.json.decode(raw)
+        except msgspec.DecodeError:
+            return json.loads(raw)
+
 
 class JSONLoader(BaseLoader):
     """
@@ -34,16 +49,26 @@ class JSONLoader(BaseLoader):
         """
         file_path = Path(file_path)
         
-        if not file_path.exists():
+        # Not memoized like YAML/TOML: the C decoder parses faster than
+        # _load_cached could deep-copy a cached result, so every load
+        # reads and parses the file afresh
+        try:
+            raw = file_path.read_bytes()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
+        except OSError as e:
+            raise ValueError(f"Error reading JSON file {file_path}: {e}")
         
+        return self._parse(raw, file_path)
+    
+    def _parse(self, raw: bytes, file_path: Path) -> Dict[str, Any]:
+        """Parse raw JSON bytes read from file_path."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-                # Ensure we always return a dictionary
-                if not isinstance(data, dict):
-                    raise ValueError(f"JSON root must be an object, got {type(data).__name__}")
-                return data
+            data = _json_decode(raw)
+            # Ensure we always return a dictionary
+            if not isinstance(data, dict):
+                raise ValueError(f"JSON root must be an object, got {type(data).__name__}")
+            return data
         except json.JSONDecodeError as e:
             raise ValueError(f"JSON parsing error in {file_path}: {e}")
         except Exception as e:
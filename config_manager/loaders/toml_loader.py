@@ -47,15 +47,15 @@ class TOMLLoader(BaseLoader):
             FileNotFoundError: If the file doesn't exist
             ValueError: If TOML parsing fails
         """
-        file_path = Path(file_path)
-        
-        if not file_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {file_path}")
-        
+        return self._load_cached(Path(file_path), self._parse,
+                                 "TOML parsing error in")
+    
+    def _parse(self, raw: bytes, file_path: Path) -> Dict[str, Any]:
+        """Parse raw TOML bytes read from file_path."""
         try:
-            with open(file_path, 'rb') as file:
-                data = tomllib.load(file)
-                return data if data is not None else {}
+            # TOML documents are always UTF-8 encoded
+            data = tomllib.loads(raw.decode('utf-8'))
+            return data if data is not None else {}
         except Exception as e:
             raise ValueError(f"TOML parsing error in {file_path}: {e}")
     
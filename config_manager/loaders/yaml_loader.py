@@ -32,16 +32,16 @@ class YAMLLoader(BaseLoader):
             FileNotFoundError: If the file doesn't exist
             ValueError: If YAML parsing fails
         """
-        file_path = Path(file_path)
-        
-        if not file_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {file_path}")
-        
+        return self._load_cached(Path(file_path), self._parse,
+                                 "Error reading YAML file")
+    
+    def _parse(self, raw: bytes, file_path: Path) -> Dict[str, Any]:
+        """Parse raw YAML bytes read from file_path."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                data = yaml.safe_load(file)
-                # Return empty dict if file is empty or contains only None
-                return data if data is not None else {}
+            # PyYAML detects the encoding and decodes the raw bytes itself
+            data = yaml.safe_load(raw)
+            # Return empty dict if file is empty or contains only None
+            return data if data is not None else {}
         except yaml.YAMLError as e:
             raise ValueError(f"YAML parsing error in {file_path}: {e}")
         except Exception as e:
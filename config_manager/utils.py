@@ -5,8 +5,19 @@ This module provides helper functions for deep merging dictionaries,
 accessing nested values with dot notation, and flattening nested structures.
 """
 
-from typing import Dict, Any, Optional, Union, List
 from copy import deepcopy
+from itertools import compress, repeat
+from typing import Dict, Any, Optional, Union, List
+
+# Sentinel for "key not present" in path walks (None is a valid value)
+_MISSING = object()
+
+# Leaf types that can be shared between merge inputs and the result;
+# any other leaf (list, set, custom object) is deep-copied
+_IMMUTABLE_LEAF_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+# Dict size above which filter_dict_by_prefix switches to map/compress
+_BULK_FILTER_THRESHOLD = 512
 
 
 def deep_merge(base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
@@ -15,6 +26,9 @@ def deep_merge(base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
     
     Values from overlay take precedence over values in base.
     Nested dictionaries are merged recursively, while other types are replaced.
+    Neither input is modified. The result shares sub-dicts of base that
+    overlay does not touch; mutable values taken from overlay (lists, sets,
+    other objects) are deep-copied so the result never aliases them.
     
     Args:
         base: Base dictionary
@@ -30,17 +44,41 @@ def deep_merge(base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
         >>> print(result)
         {"db": {"host": "remote", "port": 5432, "ssl": True}}
     """
-    result = deepcopy(base)
+    # Nothing to layer on top: a shallow copy keeps the inputs untouched
+    if not overlay:
+        return dict(base)
     
-    for key, value in overlay.items():
-        if (key in result and 
-            isinstance(result[key], dict) and 
-            isinstance(value, dict)):
-            # Recursively merge nested dictionaries
-            result[key] = deep_merge(result[key], value)
-        else:
-            # Replace with new value (deep copy to avoid references)
-            result[key] = deepcopy(value)
+    # Overlays of immutable leaves (the common override shape) need no
+    # recursion or copying: a single C-level merge suffices ({**a, **b}
+    # rather than a | b for 3.8)
+    if all(type(value) in _IMMUTABLE_LEAF_TYPES for value in overlay.values()):
+        return {**base, **overlay}
+    
+    result = dict(base)
+    
+    # Iterative walk over (target, source) pairs; only dicts on the merge
+    # path are copied, untouched sub-dicts of base are shared
+    stack = [(result, overlay)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            if isinstance(value, dict):
+                existing = target.get(key)
+                if isinstance(existing, dict):
+                    # Merge into a copy so base is never modified
+                    node = dict(existing)
+                else:
+                    # Rebuild overlay sub-dicts instead of aliasing them
+                    node = {}
+                target[key] = node
+                stack.append((node, value))
+            elif type(value) in _IMMUTABLE_LEAF_TYPES:
+                # Leaf override: no lookup of the existing value needed
+                target[key] = value
+            else:
+                # Mutable leaf: copy so callers (e.g. the loader cache)
+                # never see the merged result mutate their data
+                target[key] = deepcopy(value)
     
     return result
 
@@ -66,17 +104,56 @@ def get_nested_value(data: Dict[str, Any], key_path: str,
         >>> missing = get_nested_value(data, 'database.ssl', False)
         >>> print(missing)  # False
     """
-    keys = key_path.split(separator)
-    current_data = data
+    # Flat keys need no walk at all
+    if separator not in key_path:
+        if isinstance(data, dict):
+            return data.get(key_path, default)
+        return default
     
+    # One C-level split, then plain subscripts: on present keys this beats
+    # both peeling components one at a time and .get() with a sentinel
+    current_data = data
     try:
-        for key in keys:
+        for key in key_path.split(separator):
             if not isinstance(current_data, dict):
                 return default
             current_data = current_data[key]
-        return current_data
-    except (KeyError, TypeError):
+    except KeyError:
         return default
+    return current_data
+
+
+def get_nested_value_cached(data: Dict[str, Any], key_path: str,
+                            default: Any = None, separator: str = '.',
+                            cache: Optional[Dict[tuple, Any]] = None) -> Any:
+    """
+    Retrieve a nested value, memoizing lookups in a caller-owned cache.
+    
+    Intended for passes that read the same keys repeatedly from a
+    configuration that does not change meanwhile (e.g. template rendering).
+    Entries are keyed by (id(data), key_path, separator), so the caller must
+    discard the cache once the pass ends or data is modified.
+    
+    Args:
+        data: Dictionary to search in
+        key_path: Dot-separated path to the value (e.g., 'database.host')
+        default: Default value if key is not found
+        separator: Character used to separate nested keys
+        cache: Dictionary used as memo (None disables caching)
+        
+    Returns:
+        The value at the specified path, or default if not found
+    """
+    if cache is None:
+        return get_nested_value(data, key_path, default, separator)
+    
+    cache_key = (id(data), key_path, separator)
+    try:
+        value = cache[cache_key]
+    except KeyError:
+        # Cache misses as the sentinel so any default can be applied later
+        value = cache[cache_key] = get_nested_value(data, key_path, _MISSING, separator)
+    return default if value is _MISSING else value
 
 
 def set_nested_value(data: Dict[str, Any], key_path: str, 
@@ -97,19 +174,24 @@ def set_nested_value(data: Dict[str, Any], key_path: str,
         >>> set_nested_value(data, 'database.host', 'localhost')
         >>> print(data)  # {"database": {"host": "localhost"}}
     """
+    if separator not in key_path:
+        # Flat key: a single assignment, no walk
+        data[key_path] = value
+        return
+    
     keys = key_path.split(separator)
     current_data = data
     
-    # Navigate to the parent of the target key, creating dicts as needed
+    # Navigate to the parent of the target key, creating dicts as needed;
+    # only these intermediate components are type-checked
     for key in keys[:-1]:
-        if key not in current_data:
-            current_data[key] = {}
-        elif not isinstance(current_data[key], dict):
-            # Replace non-dict values with empty dict
-            current_data[key] = {}
-        current_data = current_data[key]
-    
-    # Set the final value
+        next_data = current_data.get(key)
+        if not isinstance(next_data, dict):
+            # Create missing dicts and replace non-dict values
+            next_data = current_data[key] = {}
+        current_data = next_data
+    
+    # Set the final value (always overwritten, never type-checked)
     current_data[keys[-1]] = value
 
 
@@ -125,17 +207,19 @@ def has_nested_key(data: Dict[str, Any], key_path: str, separator: str = '.') ->
     Returns:
         True if the key exists, False otherwise
     """
-    keys = key_path.split(separator)
-    current_data = data
+    if separator not in key_path:
+        return isinstance(data, dict) and key_path in data
     
-    try:
-        for key in keys:
-            if not isinstance(current_data, dict) or key not in current_data:
-                return False
-            current_data = current_data[key]
-        return True
-    except (KeyError, TypeError):
-        return False
+    # .get() with a sentinel rather than try/except: misses are routine
+    # here and must not pay for raising KeyError
+    current_data = data
+    for key in key_path.split(separator):
+        if not isinstance(current_data, dict):
+            return False
+        current_data = current_data.get(key, _MISSING)
+        if current_data is _MISSING:
+            return False
+    return True
 
 
 def flatten_dict(data: Dict[str, Any], separator: str = '.', 
@@ -146,7 +230,7 @@ def flatten_dict(data: Dict[str, Any], separator: str = '.',
     Args:
         data: Dictionary to flatten
         separator: Character to use for separating nested keys
-        prefix: Prefix for keys (used internally for recursion)
+        prefix: Prefix prepended to every resulting key
         
     Returns:
         Flattened dictionary with dot-separated keys
@@ -160,17 +244,51 @@ def flatten_dict(data: Dict[str, Any], separator: str = '.',
             "database.credentials.user": "admin"
         }
     """
-    result = {}
-    
+    if prefix:
+        return _flatten_with_prefix(data, prefix + separator, separator, {})
+    return _flatten_no_prefix(data, separator)
+
+
+def _flatten_no_prefix(data: Dict[str, Any], separator: str) -> Dict[str, Any]:
+    """Flatten without a prefix: top-level keys are used as-is."""
+    result: Dict[str, Any] = {}
     for key, value in data.items():
-        new_key = f"{prefix}{separator}{key}" if prefix else key
-        
         if isinstance(value, dict):
-            # Recursively flatten nested dictionaries
-            result.update(flatten_dict(value, separator, new_key))
+            # Empty dicts contribute no keys
+            if value:
+                _flatten_with_prefix(value, f"{key}{separator}", separator, result)
         else:
-            result[new_key] = value
+            result[key] = value
+    return result
+
+
+def _flatten_with_prefix(data: Dict[str, Any], key_prefix: str, separator: str,
+                         result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Flatten data into result, prepending key_prefix to every key.
     
+    key_prefix already ends with the separator. The walk is depth-first with
+    an explicit stack of (items iterator, key prefix): siblings share their
+    parent's joined prefix, so every key costs a single concatenation, and
+    insertion order follows the source.
+    """
+    stack = [(iter(data.items()), key_prefix)]
+    while stack:
+        items, key_prefix = stack[-1]
+        for key, value in items:
+            new_key = key_prefix + str(key)
+            if isinstance(value, dict):
+                if value:
+                    # Descend, resuming this level's iterator afterwards
+                    stack.append((iter(value.items()), new_key + separator))
+                    break
+                # Empty dicts contribute no keys
+                continue
+            # Direct insertion beats collecting pairs for dict(pairs): CPython
+            # does not presize a dict built from a list of pairs
+            result[new_key] = value
+        else:
+            stack.pop()
     return result
 
 
@@ -194,7 +312,19 @@ def unflatten_dict(flat_data: Dict[str, Any], separator: str = '.') -> Dict[str,
     result = {}
     
     for key_path, value in flat_data.items():
-        set_nested_value(result, key_path, value, separator)
+        if separator not in key_path:
+            result[key_path] = value
+            continue
+        
+        keys = key_path.split(separator)
+        current_data = result
+        for key in keys[:-1]:
+            next_data = current_data.setdefault(key, {})
+            if not isinstance(next_data, dict):
+                # Replace non-dict values with empty dict
+                next_data = current_data[key] = {}
+            current_data = next_data
+        current_data[keys[-1]] = value
     
     return result
 
@@ -213,15 +343,30 @@ def filter_dict_by_prefix(data: Dict[str, Any], prefix: str,
     Returns:
         Filtered dictionary
     """
-    result = {}
-    prefix_with_sep = f"{prefix}{separator}"
+    if not data:
+        return {}
     
-    for key, value in data.items():
-        if key.startswith(prefix_with_sep) or key == prefix:
-            if remove_prefix and key.startswith(prefix_with_sep):
-                new_key = key[len(prefix_with_sep):]
-            else:
-                new_key = key
-            result[new_key] = value
+    prefix_with_sep = prefix + separator
+    prefix_len = len(prefix_with_sep)
+    
+    # Large dicts without an exact-prefix key: build the match mask with
+    # map/compress so the per-key test runs in C rather than in bytecode
+    if len(data) > _BULK_FILTER_THRESHOLD and prefix not in data:
+        matches = compress(data.items(),
+                           map(str.startswith, data, repeat(prefix_with_sep)))
+        if remove_prefix:
+            return {key[prefix_len:]: value for key, value in matches}
+        return dict(matches)
+    
+    if remove_prefix:
+        # Exact prefix matches keep their key; everything else is sliced
+        return {
+            (key if key == prefix else key[prefix_len:]): value
+            for key, value in data.items()
+            if key == prefix or key.startswith(prefix_with_sep)
+        }
     
-    return result
\ No newline at end of file
+    return {
+        key: value for key, value in data.items()
+        if key == prefix or key.startswith(prefix_with_sep)
+    }
\ No newline at end of file
@@ -6,9 +6,46 @@ with built-in validators for common use cases and support for custom rules.
 """
 
 import re
-from typing import Any, Callable, Optional, List, Dict, Union
-from urllib.parse import urlparse
-from .utils import get_nested_value
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, Callable, Optional, List, Dict, Mapping, Tuple, Union
+
+# Built-in patterns, compiled once at import rather than on every call.
+# The URL pattern is a prefilter, not RFC 3986 validation: it requires a
+# scheme, '://' and a non-empty authority, and rejects whitespace
+_URL_RE = re.compile(r'^[a-z][a-z0-9+.-]*://[^\s/?#][^\s]*$', re.IGNORECASE)
+# Domains are dot-separated labels; a single label (e.g. localhost) is allowed
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9-]+(?:\.[a-zA-Z0-9-]+)*$')
+
+# Common config values that can never convert to a number; the numeric rules
+# reject them up front instead of raising (and unwinding) inside
+# int()/float(). Everything else (str, Decimal, numpy scalars, ...) is tried
+_NON_NUMERIC_TYPES = (type(None), list, dict)
+
+
+def _rule_cost(rule: 'ValidationRule') -> int:
+    """Sort key ordering a key path's rules from cheapest to costliest."""
+    # Duck-typed rules (or subclasses skipping __init__) may lack a cost
+    return getattr(rule, 'cost', 1)
+
+
+def _build_accessor(key_parts: Tuple[str, ...]) -> Callable[[Any], Any]:
+    """
+    Generate a function resolving fixed key parts through nested dicts.
+    
+    The walk is unrolled into straight-line code with the parts baked in as
+    literals (via repr), so there is no Python-level loop. Like the rule
+    trie, only dicts are descended into; a missing key or a non-dict on the
+    path yields None.
+    """
+    lines = ["def accessor(data):"]
+    for part in key_parts:
+        lines.append("    if not isinstance(data, dict): return None")
+        lines.append(f"    data = data.get({part!r})")
+    lines.append("    return data")
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace['accessor']
 
 
 class ConfigValidationError(Exception):
@@ -22,7 +59,15 @@ class ConfigValidationError(Exception):
             errors: List of validation error messages
         """
         self.errors = errors
-        super().__init__(f"Configuration validation failed: {', '.join(errors)}")
+        # The message is joined on first str() only; many callers just
+        # inspect errors. Passing errors as args keeps the exception picklable
+        self._message: Optional[str] = None
+        super().__init__(errors)
+    
+    def __str__(self) -> str:
+        if self._message is None:
+            self._message = f"Configuration validation failed: {', '.join(self.errors)}"
+        return self._message
 
 
 class ValidationRule:
@@ -32,8 +77,15 @@ class ValidationRule:
     Encapsulates a validation function with metadata and error messaging.
     """
     
+    # No per-instance __dict__; 'required' marks rules that also reject a
+    # missing key (see the built-in 'required' rule). It is left unset here
+    # so a subclass can declare required = True as a class attribute;
+    # readers use getattr(rule, 'required', False)
+    __slots__ = ('name', 'validator_func', 'error_message', 'description',
+                 'cost', 'required')
+    
     def __init__(self, name: str, validator_func: Callable[[Any], bool], 
-                 error_message: str, description: str = ""):
+                 error_message: str, description: str = "", cost: int = 1):
         """
         Initialize a validation rule.
         
@@ -42,11 +94,13 @@ class ValidationRule:
             validator_func: Function that takes a value and returns True if valid
             error_message: Message to show when validation fails
             description: Optional description of what the rule validates
+            cost: Relative evaluation cost; cheaper rules run first for a key
         """
         self.name = name
         self.validator_func = validator_func
         self.error_message = error_message
         self.description = description
+        self.cost = cost
     
     def validate(self, value: Any) -> bool:
         """
@@ -77,10 +131,51 @@ class ConfigValidator:
     """
     
     def __init__(self):
-        """Initialize the validator with built-in rules."""
-        self.rules: Dict[str, List[ValidationRule]] = {}
-        self.built_in_rules: Dict[str, ValidationRule] = {}
-        self._register_built_in_rules()
+        """Initialize the validator; built-in rules are created on first use."""
+        # Mutable rule lists; the public view is the rules property
+        self._rules: Dict[str, List[ValidationRule]] = {}
+        # Rule names per key path, kept in step with _rules for list_all_rules
+        self._rule_names: Dict[str, List[str]] = {}
+        # Read-only tuple snapshot of _rules (None when it must be rebuilt)
+        self._rules_view: Optional[Mapping[str, Tuple[ValidationRule, ...]]] = None
+        # Key paths split once at add_rule time, reused by every validation
+        self._key_parts: Dict[str, Tuple[str, ...]] = {}
+        # Generated subscript chains for validate_key, built on first use
+        self._accessors: Dict[str, Callable[[Any], Any]] = {}
+        # Prefix trie over the key paths (None when it must be rebuilt)
+        self._rule_trie: Optional[Dict[str, Any]] = None
+        # Result of the last validate call made with a revision, reused for
+        # the same config object and revision (None when rules changed or
+        # the cache was cleared)
+        self._last_config: Optional[Dict[str, Any]] = None
+        self._last_revision: Any = None
+        self._last_fail_fast = False
+        self._last_errors: Optional[List[str]] = None
+    
+    @property
+    def rules(self) -> Mapping[str, Tuple[ValidationRule, ...]]:
+        """
+        Registered rules by key path, as a read-only mapping of tuples.
+        
+        The snapshot is rebuilt only after add_rule/remove_rule, so
+        validation iterates plain tuples. Use those methods to change rules.
+        """
+        view = self._rules_view
+        if view is None:
+            view = self._rules_view = MappingProxyType({
+                key_path: tuple(rules) for key_path, rules in self._rules.items()
+            })
+        return view
+    
+    @cached_property
+    def built_in_rules(self) -> Dict[str, ValidationRule]:
+        """Built-in rules by name, built on first access."""
+        return self._build_built_in_rules()
+    
+    @cached_property
+    def _rule_factories(self) -> Dict[str, Callable[[Any], Callable[[Any], bool]]]:
+        """Factories for parameterized rules, built on first access."""
+        return self._build_rule_factories()
     
     def add_rule(self, key_path: str, rule: Union[ValidationRule, str], **kwargs) -> None:
         """
@@ -95,17 +190,30 @@ class ConfigValidator:
             ValueError: If built-in rule name is not found
         """
         if isinstance(rule, str):
-            # Use built-in rule
-            if rule not in self.built_in_rules:
-                available_rules = list(self.built_in_rules.keys())
+            # Use built-in rule (only this path builds the built-in table)
+            built_in_rules = self.built_in_rules
+            if rule not in built_in_rules:
+                available_rules = list(built_in_rules.keys())
                 raise ValueError(f"Unknown built-in rule '{rule}'. "
                                f"Available rules: {available_rules}")
-            rule = self.built_in_rules[rule]
-        
-        if key_path not in self.rules:
-            self.rules[key_path] = []
-        
-        self.rules[key_path].append(rule)
+            rule = built_in_rules[rule]
+        
+        if key_path not in self._rules:
+            self._rules[key_path] = []
+            self._key_parts[key_path] = tuple(key_path.split('.'))
+            self._rule_trie = None
+        
+        rules = self._rules[key_path]
+        rules.append(rule)
+        if len(rules) > 1 and _rule_cost(rules[-2]) > _rule_cost(rule):
+            # Keep cheap rules first; the sort is stable, so equal costs
+            # stay in insertion order
+            rules.sort(key=_rule_cost)
+            self._rule_names[key_path] = [rule.name for rule in rules]
+        else:
+            self._rule_names.setdefault(key_path, []).append(rule.name)
+        self._rules_view = None
+        self._last_errors = None
     
     def remove_rule(self, key_path: str, rule_name: Optional[str] = None) -> None:
         """
@@ -115,31 +223,54 @@ class ConfigValidator:
             key_path: Configuration key path
             rule_name: Specific rule name to remove (None to remove all)
         """
-        if key_path not in self.rules:
+        if key_path not in self._rules:
             return
         
+        self._rules_view = None
+        self._last_errors = None
         if rule_name is None:
             # Remove all rules for this key path
-            del self.rules[key_path]
+            del self._rules[key_path]
+            del self._rule_names[key_path]
+            del self._key_parts[key_path]
+            self._accessors.pop(key_path, None)
+            self._rule_trie = None
         else:
             # Remove specific rule
-            self.rules[key_path] = [
-                rule for rule in self.rules[key_path] 
+            self._rules[key_path] = [
+                rule for rule in self._rules[key_path] 
                 if rule.name != rule_name
             ]
+            self._rule_names[key_path] = [
+                name for name in self._rule_names[key_path]
+                if name != rule_name
+            ]
             
             # Clean up empty rule lists
-            if not self.rules[key_path]:
-                del self.rules[key_path]
+            if not self._rules[key_path]:
+                del self._rules[key_path]
+                del self._rule_names[key_path]
+                del self._key_parts[key_path]
+                self._accessors.pop(key_path, None)
+                self._rule_trie = None
     
     def validate(self, config_data: Dict[str, Any], 
-                raise_on_error: bool = False) -> List[str]:
+                raise_on_error: bool = False,
+                fail_fast: Optional[bool] = None,
+                revision: Any = None) -> List[str]:
         """
         Validate configuration data against all registered rules.
         
         Args:
             config_data: Configuration dictionary to validate
             raise_on_error: Whether to raise ConfigValidationError if validation fails
+            fail_fast: Stop checking a key after its first failing rule
+                (defaults to raise_on_error)
+            revision: Opt-in result reuse. When given, the result is reused
+                for the same config_data object validated with an equal
+                revision and unchanged rules; the caller must change the
+                revision whenever config_data is modified. None (the
+                default) always validates afresh.
             
         Returns:
             List of validation error messages (empty if all valid)
@@ -147,29 +278,61 @@ class ConfigValidator:
         Raises:
             ConfigValidationError: If raise_on_error=True and validation fails
         """
-        errors = []
+        if fail_fast is None:
+            fail_fast = raise_on_error
+        
+        if revision is None:
+            errors = self._validate_all(config_data, fail_fast)
+        elif (self._last_errors is not None and self._last_config is config_data
+                and self._last_revision == revision
+                and self._last_fail_fast == fail_fast):
+            errors = list(self._last_errors)
+        else:
+            errors = self._validate_all(config_data, fail_fast)
+            # Holding the object itself (not its id) rules out id reuse
+            self._last_config = config_data
+            self._last_revision = revision
+            self._last_fail_fast = fail_fast
+            self._last_errors = list(errors)
+        
+        if raise_on_error and errors:
+            raise ConfigValidationError(errors)
+        
+        return errors
+    
+    def _validate_all(self, config_data: Dict[str, Any], fail_fast: bool) -> List[str]:
+        """Run every registered rule against config_data."""
+        errors: List[str] = []
+        add_error = errors.append
+        values = self._collect_values(config_data)
         
+        # Every key path is in the trie, so values has an entry for each
         for key_path, rules in self.rules.items():
-            value = get_nested_value(config_data, key_path)
+            value = values[key_path]
             
             # Skip validation if key doesn't exist and it's not required
             if value is None:
-                # Check if any rule requires the key to exist
-                required_rules = [r for r in rules if getattr(r, 'required', False)]
-                if required_rules:
-                    errors.append(f"{key_path}: Required key is missing")
+                # Check if any rule requires the key to exist (stops at the
+                # first match instead of collecting them all)
+                if any(getattr(rule, 'required', False) for rule in rules):
+                    add_error(f"{key_path}: Required key is missing")
                 continue
             
             # Apply all rules for this key path
             for rule in rules:
                 if not rule.validate(value):
-                    errors.append(f"{key_path}: {rule.error_message} (value: {value})")
-        
-        if raise_on_error and errors:
-            raise ConfigValidationError(errors)
+                    # A single f-string builds the message in one allocation
+                    add_error(f"{key_path}: {rule.error_message} (value: {value})")
+                    if fail_fast:
+                        break
         
         return errors
     
+    def clear_cache(self) -> None:
+        """Forget the result kept for revision-based reuse in validate."""
+        self._last_config = None
+        self._last_errors = None
+    
     def validate_key(self, key_path: str, config_data: Dict[str, Any]) -> List[str]:
         """
         Validate a specific key path.
@@ -181,62 +344,120 @@ class ConfigValidator:
         Returns:
             List of validation errors for this key
         """
-        if key_path not in self.rules:
+        # Read the live list: going through the rules property could
+        # rebuild the snapshot of every key just to check one
+        rules = self._rules.get(key_path)
+        if rules is None:
             return []
         
+        accessor = self._accessors.get(key_path)
+        if accessor is None:
+            accessor = self._accessors[key_path] = _build_accessor(
+                self._key_parts[key_path])
+        
         errors = []
-        value = get_nested_value(config_data, key_path)
+        value = accessor(config_data)
         
         if value is None:
-            required_rules = [r for r in self.rules[key_path] if getattr(r, 'required', False)]
-            if required_rules:
+            if any(getattr(rule, 'required', False) for rule in rules):
                 errors.append(f"{key_path}: Required key is missing")
             return errors
         
-        for rule in self.rules[key_path]:
+        for rule in rules:
             if not rule.validate(value):
                 errors.append(f"{key_path}: {rule.error_message} (value: {value})")
         
         return errors
     
+    def _collect_values(self, config_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Resolve the values of all rule key paths in one walk over config_data.
+        
+        Key paths sharing a prefix (database.host, database.port) look up
+        that prefix once. Every key path in the trie gets an entry, None
+        when absent.
+        """
+        trie = self._rule_trie
+        if trie is None:
+            trie = self._rule_trie = self._build_rule_trie()
+        
+        values: Dict[str, Any] = {}
+        stack = [(config_data, trie)]
+        while stack:
+            data, node = stack.pop()
+            is_dict = isinstance(data, dict)
+            for part, (key_path, children) in node.items():
+                value = data.get(part) if is_dict else None
+                if key_path is not None:
+                    values[key_path] = value
+                if children:
+                    # Descend even below missing values so deeper paths get None
+                    stack.append((value, children))
+        return values
+    
+    def _build_rule_trie(self) -> Dict[str, Any]:
+        """
+        Build the key path trie used by _collect_values.
+        
+        Each node maps a key part to (key_path ending here or None, child node).
+        """
+        trie: Dict[str, Any] = {}
+        for key_path, key_parts in self._key_parts.items():
+            node = trie
+            *parents, last = key_parts
+            for part in parents:
+                end_path, children = node.get(part, (None, None))
+                if children is None:
+                    children = {}
+                    node[part] = (end_path, children)
+                node = children
+            _, children = node.get(last, (None, {}))
+            node[last] = (key_path, children)
+        return trie
+    
     def get_rules_for_key(self, key_path: str) -> List[ValidationRule]:
         """Get all rules registered for a key path."""
-        return self.rules.get(key_path, [])
+        return list(self._rules.get(key_path, ()))
     
     def list_all_rules(self) -> Dict[str, List[str]]:
         """Get a summary of all registered rules."""
+        # Copies of the name lists maintained by add_rule/remove_rule
         return {
-            key_path: [rule.name for rule in rules]
-            for key_path, rules in self.rules.items()
+            key_path: list(names)
+            for key_path, names in self._rule_names.items()
         }
     
-    def _register_built_in_rules(self):
-        """Register built-in validation rules."""
+    def _build_built_in_rules(self) -> Dict[str, ValidationRule]:
+        """Build the built-in validation rules."""
+        built_in_rules: Dict[str, ValidationRule] = {}
         
         # URL validation
+        url_match = _URL_RE.match
+        
         def is_valid_url(value):
-            try:
-                result = urlparse(str(value))
-                return all([result.scheme, result.netloc])
-            except:
-                return False
+            return url_match(str(value)) is not None
         
-        self.built_in_rules['url'] = ValidationRule(
+        built_in_rules['url'] = ValidationRule(
             "url",
             is_valid_url,
             "must be a valid URL with scheme and netloc",
-            "Validates URLs (http://example.com)"
+            "Validates URLs (http://example.com)",
+            cost=5
         )
         
         # Port validation
         def is_valid_port(value):
-            try:
-                port = int(value)
-                return 1 <= port <= 65535
-            except:
+            # Exact ints (the common case) skip the int() call; unparsable
+            # strings are reported as failures by ValidationRule.validate
+            if type(value) is int:
+                port = value
+            elif isinstance(value, _NON_NUMERIC_TYPES):
                 return False
+            else:
+                port = int(value)
+            return 1 <= port <= 65535
         
-        self.built_in_rules['port'] = ValidationRule(
+        built_in_rules['port'] = ValidationRule(
             "port",
             is_valid_port,
             "must be a valid port number (1-65535)",
@@ -244,19 +465,23 @@ class ConfigValidator:
         )
         
         # Email validation
+        email_match = _EMAIL_RE.match
+        
         def is_valid_email(value):
-            pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            return re.match(pattern, str(value)) is not None
+            return email_match(str(value)) is not None
         
-        self.built_in_rules['email'] = ValidationRule(
+        built_in_rules['email'] = ValidationRule(
             "email",
             is_valid_email,
             "must be a valid email address",
-            "Validates email addresses"
+            "Validates email addresses",
+            cost=5
         )
         
         # Required (non-empty) validation
         def is_not_empty(value):
+            # Identity and type checks only: never calls __eq__ on the value,
+            # so objects with unusual equality (arrays, ORM expressions) pass
             if value is None:
                 return False
             if isinstance(value, str):
@@ -265,13 +490,19 @@ class ConfigValidator:
                 return len(value) > 0
             return True
         
-        self.built_in_rules['required'] = ValidationRule(
+        built_in_rules['required'] = ValidationRule(
             "required", 
             is_not_empty,
             "is required and cannot be empty",
-            "Ensures value is not None or empty"
+            "Ensures value is not None or empty",
+            cost=0
         )
-        self.built_in_rules['required'].required = True  # Mark as required rule
+        built_in_rules['required'].required = True  # Mark as required rule
+        
+        return built_in_rules
+    
+    def _build_rule_factories(self) -> Dict[str, Callable[[Any], Callable[[Any], bool]]]:
+        """Build the factory functions for parameterized rules."""
         
         # String length validation
         def make_min_length_validator(min_len):
@@ -284,27 +515,34 @@ class ConfigValidator:
                 return len(str(value)) <= max_len
             return validator
         
-        # Numeric range validation
+        # Numeric range validation (unparsable strings are turned into
+        # failures by ValidationRule.validate, no per-call handler needed)
         def make_min_value_validator(min_val):
             def validator(value):
-                try:
-                    return float(value) >= min_val
-                except:
-                    return False
+                return not isinstance(value, _NON_NUMERIC_TYPES) and float(value) >= min_val
             return validator
         
         def make_max_value_validator(max_val):
             def validator(value):
-                try:
-                    return float(value) <= max_val
-                except:
-                    return False
+                return not isinstance(value, _NON_NUMERIC_TYPES) and float(value) <= max_val
             return validator
         
         # Choice validation
         def make_choice_validator(choices):
+            try:
+                choice_set = frozenset(choices)
+            except TypeError:
+                # Unhashable choices can only be scanned
+                def validator(value):
+                    return value in choices
+                return validator
+            
             def validator(value):
-                return value in choices
+                try:
+                    return value in choice_set
+                except TypeError:
+                    # Unhashable value (e.g. a list): compare by equality
+                    return value in choices
             return validator
         
         # Pattern validation
@@ -314,8 +552,8 @@ class ConfigValidator:
                 return compiled_pattern.match(str(value)) is not None
             return validator
         
-        # Register factory functions for dynamic rules
-        self._rule_factories = {
+        # Factory functions for dynamic rules
+        return {
             'min_length': make_min_length_validator,
             'max_length': make_max_length_validator,
             'min_value': make_min_value_validator,
@@ -361,11 +599,11 @@ class ConfigValidator:
     def add_range_rule(self, key_path: str, min_val: float, max_val: float) -> None:
         """Add numeric range validation rule."""
         def range_validator(value):
-            try:
-                num_val = float(value)
-                return min_val <= num_val <= max_val
-            except:
+            # Unparsable strings raise, which ValidationRule.validate reports
+            # as a failure
+            if isinstance(value, _NON_NUMERIC_TYPES):
                 return False
+            return min_val <= float(value) <= max_val
         
         rule = ValidationRule(
             f"range_{min_val}_{max_val}",
@@ -303,6 +303,13 @@ database:
         assert "app" in top_level_keys
         assert "database" in top_level_keys
     
+    def test_keys_match_items_with_empty_sections(self):
+        """Test keys() and items() agree when a section is empty."""
+        config = ConfigManager()
+        config.load_dict({"a": {}, "b": {"c": 1}})
+        
+        assert config.keys() == [key for key, _ in config.items()] == ["b.c"]
+    
     def test_save_and_reload(self):
         """Test saving configuration to file and reloading."""
         original_config = {
@@ -362,6 +369,32 @@ database:
         finally:
             Path(temp_path).unlink()
     
+    def test_reload_rereads_files(self):
+        """Test reload re-reads files and discards in-memory mutations."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump({"hosts": ["a"], "mode": "x"}, f)
+            temp_path = f.name
+        
+        try:
+            config = ConfigManager()
+            config.load_file(temp_path)
+            
+            config.get("hosts").append("X")
+            config.reload()
+            assert config.get("hosts") == ["a"]
+            
+            # Same-size edit with the original timestamps restored
+            stat = os.stat(temp_path)
+            with open(temp_path, 'w') as f:
+                json.dump({"hosts": ["b"], "mode": "y"}, f)
+            os.utime(temp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            
+            config.reload()
+            assert config.get("hosts") == ["b"]
+            assert config.get("mode") == "y"
+        finally:
+            Path(temp_path).unlink()
+    
     def test_validation_integration(self):
         """Test validation integration with ConfigManager."""
         config = ConfigManager()
@@ -416,6 +449,31 @@ database:
         assert "new_key" in resolved3
         assert resolved3["new_key"] == "new_value"
     
+    def test_to_dict_shares_nested_values(self):
+        """Test to_dict copies the top level only, with or without overrides."""
+        config = ConfigManager()
+        config.load_dict({
+            "database": {"host": "localhost", "hosts": ["a"]},
+            "app": {"name": "MyApp"},
+            "production": {"app": {"name": "ProdApp"}}
+        })
+        
+        for environment in ("development", "production"):
+            config.set_environment(environment)
+            result = config.to_dict()
+            
+            # Top-level changes stay local to the returned dict
+            result["extra"] = True
+            assert "extra" not in config.config_data
+            
+            # Sections the environment leaves alone are shared, not copied
+            assert result["database"] is config.config_data["database"]
+            assert result["database"]["hosts"] is config.config_data["database"]["hosts"]
+        
+        # Overridden sections are merged copies; the base stays untouched
+        assert config.to_dict()["app"] == {"name": "ProdApp"}
+        assert config.config_data["app"] == {"name": "MyApp"}
+    
     def test_string_representations(self):
         """Test string representation methods."""
         config = ConfigManager()
@@ -63,7 +63,16 @@ class TestEnvironment:
         
         with pytest.raises(ValueError, match="Unknown environment"):
             Environment.from_string("unknown")
-    
+
+    def test_from_normalized(self):
+        """Test lookup of already-normalized environment strings."""
+        assert Environment._from_normalized("prod") == Environment.PRODUCTION
+        assert Environment._from_normalized("staging") == Environment.STAGING
+
+        # No normalization is applied
+        with pytest.raises(ValueError, match="Unknown environment"):
+            Environment._from_normalized("PROD")
+
     def test_string_representation(self):
         """Test string representation of Environment."""
         assert str(Environment.DEVELOPMENT) == "development"
@@ -149,6 +158,15 @@ class TestEnvironmentManager:
         manager.set_environment("production")
         
         assert manager.current_environment == Environment.PRODUCTION
+
+    def test_set_environment_not_re_resolved(self):
+        """Test explicitly set environment is not re-read from env var."""
+        manager = EnvironmentManager()
+        manager.set_environment("production")
+
+        os.environ['APP_ENV'] = 'staging'
+        assert manager.current_environment == Environment.PRODUCTION
+        assert manager.get_environment_config_key('db.host') == 'production.db.host'
     
     def test_set_environment_invalid_string(self):
         """Test setting invalid environment string raises ValueError."""
@@ -205,6 +205,41 @@ class TestJSONLoader:
         finally:
             Path(temp_path).unlink()
     
+    def test_load_json_standard_library_grammar(self):
+        """Test values the json module accepts (NaN, big ints) load."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            f.write('{"a": NaN, "b": 123456789012345678901234567890}')
+            temp_path = f.name
+        
+        try:
+            data = JSONLoader().load(temp_path)
+            
+            assert data["a"] != data["a"]  # NaN
+            assert data["b"] == 123456789012345678901234567890
+        finally:
+            Path(temp_path).unlink()
+    
+    def test_load_json_msgspec_falls_back_to_json(self, monkeypatch):
+        """Test msgspec decodes first and json takes over what it rejects."""
+        msgspec = pytest.importorskip("msgspec")
+        
+        calls = []
+        def reject(raw):
+            calls.append(raw)
+            raise msgspec.DecodeError("rejected")
+        
+        monkeypatch.setattr(msgspec.json, "decode", reject)
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            f.write('{"a": 1}')
+            temp_path = f.name
+        
+        try:
+            assert JSONLoader().load(temp_path) == {"a": 1}
+            assert calls == [b'{"a": 1}']
+        finally:
+            Path(temp_path).unlink()
+    
     def test_load_non_dict_json(self):
         """Test loading JSON file with non-dictionary root."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
@@ -482,4 +517,59 @@ port = 5432
             
             # Verify data is correct
             loaded_data = loader.load(nested_path)
-            assert loaded_data == test_data
\ No newline at end of file
+            assert loaded_data == test_data
+    
+    @pytest.mark.parametrize("loader_class, message", [
+        (YAMLLoader, "Error reading YAML file"),
+        (JSONLoader, "Error reading JSON file"),
+        (TOMLLoader, "TOML parsing error"),
+    ])
+    def test_load_unreadable_path_raises_value_error(self, loader_class, message):
+        """Test read errors other than a missing file are wrapped."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with pytest.raises(ValueError, match=message):
+                loader_class().load(temp_dir)
+    
+    def test_load_cache_reuses_unchanged_file(self):
+        """Test that unchanged files are served from the loader cache."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "config.yaml"
+            config_path.write_text("version: 1\nhosts: [a]\n")
+            
+            loader = YAMLLoader()
+            parse = loader._parse
+            parsed = []
+            loader._parse = lambda raw, path: parsed.append(path) or parse(raw, path)
+            
+            first = loader.load(config_path)
+            first["hosts"].append("X")
+            
+            # Served from the cache, but as a fresh copy
+            second = loader.load(config_path)
+            assert second == {"version": 1, "hosts": ["a"]}
+            assert len(parsed) == 1
+            
+            # Changing the file (size differs) forces a re-parse
+            config_path.write_text("version: 22\n")
+            assert loader.load(config_path) == {"version": 22}
+            assert len(parsed) == 2
+            
+            # Explicit invalidation drops the cached entry
+            loader.invalidate(config_path)
+            assert loader.load(config_path) == {"version": 22}
+            assert len(parsed) == 3
+    
+    def test_load_json_parses_every_time(self):
+        """Test that JSON files bypass the loader cache."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "config.json"
+            config_path.write_text('{"version": 1}')
+            
+            loader = JSONLoader()
+            parse = loader._parse
+            parsed = []
+            loader._parse = lambda raw, path: parsed.append(path) or parse(raw, path)
+            
+            assert loader.load(config_path) == {"version": 1}
+            assert loader.load(config_path) == {"version": 1}
+            assert len(parsed) == 2
\ No newline at end of file
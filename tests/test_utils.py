@@ -2,10 +2,13 @@
 Tests for utility functions.
 """
 
+import copy
+
 import pytest
 from config_manager.utils import (
     deep_merge, 
     get_nested_value, 
+    get_nested_value_cached,
     set_nested_value,
     has_nested_key,
     flatten_dict,
@@ -14,6 +17,32 @@ from config_manager.utils import (
 )
 
 
+# Shared read-only fixtures; tests that mutate use the deep-copying fixture
+NESTED_CONFIG = {
+    "app": {
+        "name": "MyApp",
+        "database": {
+            "host": "localhost",
+            "port": 5432
+        }
+    },
+    "debug": True
+}
+
+FLAT_CONFIG = {
+    "app.name": "MyApp",
+    "app.database.host": "localhost",
+    "app.database.port": 5432,
+    "debug": True
+}
+
+
+@pytest.fixture
+def nested_config():
+    """Fresh, mutable copy of NESTED_CONFIG."""
+    return copy.deepcopy(NESTED_CONFIG)
+
+
 class TestDeepMerge:
     """Test suite for deep_merge function."""
     
@@ -114,62 +143,92 @@ class TestDeepMerge:
         
         result = deep_merge({}, {})
         assert result == {}
-
-
-class TestGetNestedValue:
-    """Test suite for get_nested_value function."""
     
-    def test_get_simple_key(self):
-        """Test getting simple top-level key."""
-        data = {"key": "value"}
+    def test_merge_copies_mutable_overlay_values(self):
+        """Test mutating merged lists leaves the overlay untouched."""
+        overlay = {"hosts": ["a"], "db": {"replicas": ["r1"]}}
         
-        result = get_nested_value(data, "key")
-        assert result == "value"
-    
-    def test_get_nested_key(self):
-        """Test getting nested key with dot notation."""
-        data = {
-            "app": {
-                "database": {
-                    "host": "localhost",
-                    "port": 5432
-                }
-            }
-        }
+        result = deep_merge({}, overlay)
+        result["hosts"].append("X")
+        result["db"]["replicas"].append("X")
         
-        assert get_nested_value(data, "app.database.host") == "localhost"
-        assert get_nested_value(data, "app.database.port") == 5432
+        assert overlay == {"hosts": ["a"], "db": {"replicas": ["r1"]}}
+        
+        # Leaf-only overlay (no nested dicts)
+        overlay = {"hosts": ["a"]}
+        deep_merge({"port": 80}, overlay)["hosts"].append("X")
+        assert overlay == {"hosts": ["a"]}
     
-    def test_get_nonexistent_key(self):
-        """Test getting non-existent key returns default."""
-        data = {"existing": "value"}
+    def test_merge_shares_untouched_base_values(self):
+        """Test base sub-dicts the overlay does not touch are shared, not copied."""
+        base = {"db": {"host": "localhost", "hosts": ["a"]}, "app": {"name": "MyApp"}}
         
-        result = get_nested_value(data, "nonexistent")
-        assert result is None
+        result = deep_merge(base, {"app": {"name": "Other"}})
         
-        result = get_nested_value(data, "nonexistent", "default")
-        assert result == "default"
+        assert result["db"] is base["db"]
+        assert result["app"] is not base["app"]
+        assert base["app"] == {"name": "MyApp"}
+
+
+class TestGetNestedValue:
+    """Test suite for get_nested_value function."""
     
-    def test_get_partial_path_exists(self):
-        """Test getting key where partial path exists but not full path."""
-        data = {"app": {"name": "MyApp"}}
-        
-        result = get_nested_value(data, "app.database.host", "default")
-        assert result == "default"
+    @pytest.mark.parametrize("data,path,separator,expected", [
+        # Simple top-level key
+        ({"key": "value"}, "key", ".", "value"),
+        # Nested keys with dot notation
+        (NESTED_CONFIG, "app.database.host", ".", "localhost"),
+        (NESTED_CONFIG, "app.database.port", ".", 5432),
+        # Custom separator
+        ({"app": {"db": {"host": "localhost"}}}, "app/db/host", "/", "localhost"),
+        # Missing keys, partial paths and non-dict intermediates
+        ({"existing": "value"}, "nonexistent", ".", "default"),
+        ({"app": {"name": "MyApp"}}, "app.database.host", ".", "default"),
+        ({"app": "string_value"}, "app.nested.key", ".", "default"),
+    ])
+    def test_get(self, data, path, separator, expected):
+        """Test getting values, falling back to the default when missing."""
+        assert get_nested_value(data, path, "default", separator) == expected
+    
+    def test_get_nonexistent_key_default_none(self):
+        """Test getting non-existent key returns None without a default."""
+        assert get_nested_value({"existing": "value"}, "nonexistent") is None
+    
+    def test_get_empty_separator(self):
+        """Test an empty separator is rejected instead of looping forever."""
+        with pytest.raises(ValueError, match="empty separator"):
+            get_nested_value({"": {}}, "a", separator="")
+
+
+class TestGetNestedValueCached:
+    """Test suite for get_nested_value_cached function."""
     
-    def test_get_custom_separator(self):
-        """Test getting nested value with custom separator."""
+    def test_cached_lookup(self):
+        """Test that repeated lookups are served from the cache."""
         data = {"app": {"db": {"host": "localhost"}}}
+        cache = {}
+        
+        assert get_nested_value_cached(data, "app.db.host", cache=cache) == "localhost"
         
-        result = get_nested_value(data, "app/db/host", separator="/")
-        assert result == "localhost"
+        # Changes to data are not seen until the cache is discarded
+        data["app"]["db"]["host"] = "remote"
+        assert get_nested_value_cached(data, "app.db.host", cache=cache) == "localhost"
+        assert get_nested_value_cached(data, "app.db.host", cache={}) == "remote"
     
-    def test_get_non_dict_intermediate(self):
-        """Test getting value when intermediate path is not a dict."""
-        data = {"app": "string_value"}
+    def test_cached_missing_key_uses_default(self):
+        """Test that cached misses honour the default of each call."""
+        data = {"app": {}}
+        cache = {}
         
-        result = get_nested_value(data, "app.nested.key", "default")
-        assert result == "default"
+        assert get_nested_value_cached(data, "app.port", 1, cache=cache) == 1
+        assert get_nested_value_cached(data, "app.port", 2, cache=cache) == 2
+    
+    def test_without_cache(self):
+        """Test that no cache falls back to a plain lookup."""
+        data = {"app": {"name": "MyApp"}}
+        
+        assert get_nested_value_cached(data, "app.name") == "MyApp"
+        assert get_nested_value_cached(data, "app.missing", "default") == "default"
 
 
 class TestSetNestedValue:
@@ -196,27 +255,22 @@ class TestSetNestedValue:
         }
         assert data == expected
     
-    def test_set_existing_nested_structure(self):
+    def test_set_existing_nested_structure(self, nested_config):
         """Test setting value in existing nested structure."""
-        data = {
-            "app": {
-                "name": "MyApp",
-                "database": {"port": 5432}
-            }
-        }
-        
-        set_nested_value(data, "app.database.host", "localhost")
+        set_nested_value(nested_config, "app.database.ssl", True)
         
         expected = {
             "app": {
                 "name": "MyApp",
                 "database": {
+                    "host": "localhost",
                     "port": 5432,
-                    "host": "localhost"
+                    "ssl": True
                 }
-            }
+            },
+            "debug": True
         }
-        assert data == expected
+        assert nested_config == expected
     
     def test_set_override_non_dict(self):
         """Test setting value that overrides non-dict intermediate."""
@@ -245,105 +299,72 @@ class TestSetNestedValue:
             }
         }
         assert data == expected
+    
+    def test_set_empty_separator(self):
+        """Test an empty separator is rejected instead of looping forever."""
+        with pytest.raises(ValueError, match="empty separator"):
+            set_nested_value({}, "a", 1, separator="")
 
 
 class TestHasNestedKey:
     """Test suite for has_nested_key function."""
     
-    def test_has_existing_key(self):
-        """Test checking for existing keys."""
-        data = {
-            "app": {
-                "database": {
-                    "host": "localhost"
-                }
-            }
-        }
-        
-        assert has_nested_key(data, "app") is True
-        assert has_nested_key(data, "app.database") is True
-        assert has_nested_key(data, "app.database.host") is True
-    
-    def test_has_nonexistent_key(self):
-        """Test checking for non-existent keys."""
-        data = {"app": {"name": "MyApp"}}
-        
-        assert has_nested_key(data, "nonexistent") is False
-        assert has_nested_key(data, "app.nonexistent") is False
-        assert has_nested_key(data, "app.database.host") is False
-    
-    def test_has_key_non_dict_intermediate(self):
-        """Test checking key with non-dict intermediate value."""
-        data = {"app": "string_value"}
-        
-        assert has_nested_key(data, "app") is True
-        assert has_nested_key(data, "app.nested") is False
-    
-    def test_has_key_custom_separator(self):
-        """Test checking key with custom separator."""
-        data = {"app": {"db": {"host": "localhost"}}}
-        
-        assert has_nested_key(data, "app/db/host", separator="/") is True
-        assert has_nested_key(data, "app/db/port", separator="/") is False
+    @pytest.mark.parametrize("data,path,separator,expected", [
+        # Existing keys at every level
+        (NESTED_CONFIG, "app", ".", True),
+        (NESTED_CONFIG, "app.database", ".", True),
+        (NESTED_CONFIG, "app.database.host", ".", True),
+        # Non-existent keys
+        ({"app": {"name": "MyApp"}}, "nonexistent", ".", False),
+        ({"app": {"name": "MyApp"}}, "app.nonexistent", ".", False),
+        ({"app": {"name": "MyApp"}}, "app.database.host", ".", False),
+        # Non-dict intermediate value
+        ({"app": "string_value"}, "app", ".", True),
+        ({"app": "string_value"}, "app.nested", ".", False),
+        # Custom separator
+        ({"app": {"db": {"host": "localhost"}}}, "app/db/host", "/", True),
+        ({"app": {"db": {"host": "localhost"}}}, "app/db/port", "/", False),
+    ])
+    def test_has(self, data, path, separator, expected):
+        """Test checking for nested keys."""
+        assert has_nested_key(data, path, separator) is expected
 
 
 class TestFlattenDict:
     """Test suite for flatten_dict function."""
     
-    def test_flatten_simple_dict(self):
-        """Test flattening simple dictionary."""
-        data = {"a": 1, "b": 2}
-        
-        result = flatten_dict(data)
-        
-        expected = {"a": 1, "b": 2}
-        assert result == expected
-    
-    def test_flatten_nested_dict(self):
-        """Test flattening nested dictionary."""
-        data = {
-            "app": {
-                "name": "MyApp",
-                "database": {
-                    "host": "localhost",
-                    "port": 5432
-                }
-            },
-            "debug": True
-        }
-        
+    @pytest.mark.parametrize("data,kwargs,expected", [
+        # Simple dictionary
+        ({"a": 1, "b": 2}, {}, {"a": 1, "b": 2}),
+        # Nested dictionary
+        (NESTED_CONFIG, {}, FLAT_CONFIG),
+        # Custom separator
+        ({"app": {"db": {"host": "localhost"}}}, {"separator": "/"},
+         {"app/db/host": "localhost"}),
+        # Prefix
+        ({"db": {"host": "localhost"}}, {"prefix": "config"},
+         {"config.db.host": "localhost"}),
+        # Empty dictionary
+        ({}, {}, {}),
+    ])
+    def test_flatten(self, data, kwargs, expected):
+        """Test flattening dictionaries."""
+        assert flatten_dict(data, **kwargs) == expected
+
+    def test_flatten_preserves_key_order(self):
+        """Test that flattened keys follow depth-first source order."""
+        data = {"a": {"x": 1, "y": {"z": 2}}, "b": 3, "c": {"w": 4}}
+
         result = flatten_dict(data)
+
+        assert list(result) == ["a.x", "a.y.z", "b", "c.w"]
+
+    def test_flatten_drops_empty_nested_dict(self):
+        """Test that empty nested dictionaries contribute no keys."""
+        data = {"app": {"plugins": {}, "name": "MyApp"}, "extra": {}}
         
-        expected = {
-            "app.name": "MyApp",
-            "app.database.host": "localhost",
-            "app.database.port": 5432,
-            "debug": True
-        }
-        assert result == expected
-    
-    def test_flatten_custom_separator(self):
-        """Test flattening with custom separator."""
-        data = {"app": {"db": {"host": "localhost"}}}
-        
-        result = flatten_dict(data, separator="/")
-        
-        expected = {"app/db/host": "localhost"}
-        assert result == expected
-    
-    def test_flatten_with_prefix(self):
-        """Test flattening with prefix."""
-        data = {"db": {"host": "localhost"}}
-        
-        result = flatten_dict(data, prefix="config")
-        
-        expected = {"config.db.host": "localhost"}
-        assert result == expected
-    
-    def test_flatten_empty_dict(self):
-        """Test flattening empty dictionary."""
-        result = flatten_dict({})
-        assert result == {}
+        assert flatten_dict(data) == {"app.name": "MyApp"}
+        assert flatten_dict(data, prefix="cfg") == {"cfg.app.name": "MyApp"}
 
 
 class TestUnflattenDict:
@@ -360,26 +381,9 @@ class TestUnflattenDict:
     
     def test_unflatten_nested_keys(self):
         """Test unflattening dictionary with nested keys."""
-        flat_data = {
-            "app.name": "MyApp",
-            "app.database.host": "localhost",
-            "app.database.port": 5432,
-            "debug": True
-        }
-        
-        result = unflatten_dict(flat_data)
+        result = unflatten_dict(FLAT_CONFIG)
         
-        expected = {
-            "app": {
-                "name": "MyApp",
-                "database": {
-                    "host": "localhost",
-                    "port": 5432
-                }
-            },
-            "debug": True
-        }
-        assert result == expected
+        assert result == NESTED_CONFIG
     
     def test_unflatten_custom_separator(self):
         """Test unflattening with custom separator."""
@@ -392,103 +396,45 @@ class TestUnflattenDict:
     
     def test_flatten_unflatten_roundtrip(self):
         """Test that flatten and unflatten are inverse operations."""
-        original = {
-            "app": {
-                "name": "MyApp",
-                "database": {
-                    "host": "localhost",
-                    "port": 5432
-                }
-            },
-            "debug": True
-        }
-        
-        flattened = flatten_dict(original)
+        flattened = flatten_dict(NESTED_CONFIG)
         unflattened = unflatten_dict(flattened)
         
-        assert unflattened == original
+        assert unflattened == NESTED_CONFIG
 
 
 class TestFilterDictByPrefix:
     """Test suite for filter_dict_by_prefix function."""
     
-    def test_filter_basic_prefix(self):
-        """Test filtering dictionary by prefix."""
-        data = {
-            "app.name": "MyApp",
-            "app.version": "1.0",
-            "database.host": "localhost",
-            "database.port": 5432
-        }
-        
-        result = filter_dict_by_prefix(data, "app")
-        
-        expected = {
+    @pytest.mark.parametrize("data,prefix,kwargs,expected", [
+        # Basic prefix
+        ({"app.name": "MyApp", "app.version": "1.0",
+          "database.host": "localhost", "database.port": 5432},
+         "app", {}, {"app.name": "MyApp", "app.version": "1.0"}),
+        # Prefix removal
+        ({"app.name": "MyApp", "app.version": "1.0", "database.host": "localhost"},
+         "app", {"remove_prefix": True}, {"name": "MyApp", "version": "1.0"}),
+        # Exact prefix matches are included
+        ({"app": "application", "app.name": "MyApp", "other": "value"},
+         "app", {}, {"app": "application", "app.name": "MyApp"}),
+        # Custom separator
+        ({"app/name": "MyApp", "app/version": "1.0", "db/host": "localhost"},
+         "app", {"separator": "/"}, {"app/name": "MyApp", "app/version": "1.0"}),
+        # No matches
+        ({"database.host": "localhost", "cache.ttl": 3600}, "app", {}, {}),
+        # Empty dictionary
+        ({}, "app", {}, {}),
+    ])
+    def test_filter(self, data, prefix, kwargs, expected):
+        """Test filtering dictionaries by key prefix."""
+        assert filter_dict_by_prefix(data, prefix, **kwargs) == expected
+    
+    def test_filter_large_dict(self):
+        """Test filtering a dictionary large enough for the bulk path."""
+        data = {f"svc{i}.port": i for i in range(1000)}
+        data.update({"app.name": "MyApp", "app.version": "1.0"})
+        
+        assert filter_dict_by_prefix(data, "app") == {
             "app.name": "MyApp",
             "app.version": "1.0"
         }
-        assert result == expected
-    
-    def test_filter_with_remove_prefix(self):
-        """Test filtering with prefix removal."""
-        data = {
-            "app.name": "MyApp",
-            "app.version": "1.0",
-            "database.host": "localhost"
-        }
-        
-        result = filter_dict_by_prefix(data, "app", remove_prefix=True)
-        
-        expected = {
-            "name": "MyApp",
-            "version": "1.0"
-        }
-        assert result == expected
-    
-    def test_filter_exact_match(self):
-        """Test filtering includes exact prefix matches."""
-        data = {
-            "app": "application",
-            "app.name": "MyApp",
-            "other": "value"
-        }
-        
-        result = filter_dict_by_prefix(data, "app")
-        
-        expected = {
-            "app": "application",
-            "app.name": "MyApp"
-        }
-        assert result == expected
-    
-    def test_filter_custom_separator(self):
-        """Test filtering with custom separator."""
-        data = {
-            "app/name": "MyApp",
-            "app/version": "1.0",
-            "db/host": "localhost"
-        }
-        
-        result = filter_dict_by_prefix(data, "app", separator="/")
-        
-        expected = {
-            "app/name": "MyApp",
-            "app/version": "1.0"
-        }
-        assert result == expected
-    
-    def test_filter_no_matches(self):
-        """Test filtering with no matches."""
-        data = {
-            "database.host": "localhost",
-            "cache.ttl": 3600
-        }
-        
-        result = filter_dict_by_prefix(data, "app")
-        
-        assert result == {}
-    
-    def test_filter_empty_dict(self):
-        """Test filtering empty dictionary."""
-        result = filter_dict_by_prefix({}, "app")
-        assert result == {}
\ No newline at end of file
+        assert filter_dict_by_prefix(data, "svc7", remove_prefix=True) == {"port": 7}
@@ -2,6 +2,10 @@
 Tests for configuration validation functionality.
 """
 
+import pickle
+from decimal import Decimal
+from types import MappingProxyType
+
 import pytest
 from config_manager.validators import (
     ValidationRule, 
@@ -28,6 +32,22 @@ class TestValidationRule:
         assert rule.name == "positive_number"
         assert rule.error_message == "must be a positive number"
         assert rule.description == "Validates that a number is positive"
+        assert getattr(rule, 'required', False) is False
+        
+        # Slotted: arbitrary attributes cannot be attached
+        with pytest.raises(AttributeError):
+            rule.extra = True
+    
+    def test_subclass_required_class_attribute(self):
+        """Test a subclass can mark its rules required with a class attribute."""
+        class RequiredRule(ValidationRule):
+            required = True
+        
+        validator = ConfigValidator()
+        validator.add_rule("a.b", RequiredRule("present", bool, "must be set"))
+        
+        assert validator.validate({}) == ["a.b: Required key is missing"]
+        assert validator.validate_key("a.b", {}) == ["a.b: Required key is missing"]
     
     def test_validation_rule_validate_pass(self):
         """Test validation rule that passes."""
@@ -93,6 +113,16 @@ class TestConfigValidator:
         assert 'email' in validator.built_in_rules
         assert 'required' in validator.built_in_rules
     
+    def test_built_in_rules_built_lazily(self):
+        """Test built-in rules are only built when first needed."""
+        validator = ConfigValidator()
+        validator.add_min_length_rule("password", 8)
+        
+        assert 'built_in_rules' not in vars(validator)
+        
+        validator.add_rule("database.port", "port")
+        assert 'built_in_rules' in vars(validator)
+    
     def test_add_built_in_rule(self):
         """Test adding built-in validation rules."""
         validator = ConfigValidator()
@@ -134,6 +164,18 @@ class TestConfigValidator:
         assert "port" in rule_names
         assert "required" in rule_names
     
+    def test_rules_view_is_read_only(self):
+        """Test the rules mapping is a read-only snapshot of tuples."""
+        validator = ConfigValidator()
+        validator.add_rule("server.port", "port")
+        
+        assert isinstance(validator.rules["server.port"], tuple)
+        with pytest.raises(TypeError):
+            validator.rules["server.host"] = ()
+        
+        validator.add_rule("server.port", "required")
+        assert len(validator.rules["server.port"]) == 2
+    
     def test_add_unknown_built_in_rule(self):
         """Test adding unknown built-in rule raises ValueError."""
         validator = ConfigValidator()
@@ -229,6 +271,30 @@ class TestConfigValidator:
         assert "required.key" in errors[0]
         assert "Required key is missing" in errors[0]
     
+    def test_validate_non_dict_intermediate(self):
+        """Test a key path through a non-dict value counts as missing."""
+        validator = ConfigValidator()
+        validator.add_rule("database.port", "required")
+        
+        errors = validator.validate({"database": "postgres://localhost"})
+        assert errors == ["database.port: Required key is missing"]
+    
+    def test_validate_after_rule_changes(self):
+        """Test rules added or removed between validations are honoured."""
+        config_data = {"database": {"port": 99999, "host": ""}}
+        
+        validator = ConfigValidator()
+        validator.add_rule("database.port", "port")
+        assert len(validator.validate(config_data)) == 1
+        
+        validator.add_rule("database.host", "required")
+        assert len(validator.validate(config_data)) == 2
+        
+        validator.remove_rule("database.port")
+        errors = validator.validate(config_data)
+        assert len(errors) == 1
+        assert errors[0].startswith("database.host")
+    
     def test_validate_with_raise_on_error(self):
         """Test validation with raise_on_error flag."""
         config_data = {
@@ -249,6 +315,83 @@ class TestConfigValidator:
         assert len(exc_info.value.errors) == 1
         assert "database.port" in exc_info.value.errors[0]
     
+    def test_validate_fail_fast(self):
+        """Test fail_fast stops at the first failing rule of each key."""
+        config_data = {"admin": {"email": "x"}, "database": {"port": 0}}
+        
+        validator = ConfigValidator()
+        validator.add_rule("admin.email", "email")
+        validator.add_rule("admin.email", validator.create_custom_rule(
+            "long", lambda value: len(value) > 3, "is too short"))
+        validator.add_rule("database.port", "port")
+        
+        assert len(validator.validate(config_data)) == 3
+        
+        errors = validator.validate(config_data, fail_fast=True)
+        assert errors == [
+            "admin.email: is too short (value: x)",
+            "database.port: must be a valid port number (1-65535) (value: 0)",
+        ]
+        
+        with pytest.raises(ConfigValidationError) as exc_info:
+            validator.validate(config_data, raise_on_error=True)
+        assert len(exc_info.value.errors) == 2
+    
+    def test_rules_ordered_by_cost(self):
+        """Test cheaper rules are ordered before costlier ones."""
+        validator = ConfigValidator()
+        validator.add_rule("api.url", "url")
+        validator.add_rule("api.url", "required")
+        
+        assert [rule.name for rule in validator.rules["api.url"]] == ["required", "url"]
+    
+    def test_rules_without_cost_default_to_one(self):
+        """Test rules that never set a cost can share a key path."""
+        class BareRule(ValidationRule):
+            def __init__(self, name):
+                # Deliberately skips ValidationRule.__init__
+                self.name = name
+                self.validator_func = bool
+                self.error_message = "must be set"
+        
+        validator = ConfigValidator()
+        validator.add_rule("api.url", BareRule("first"))
+        validator.add_rule("api.url", BareRule("second"))
+        validator.add_rule("api.url", "url")
+        
+        names = [rule.name for rule in validator.rules["api.url"]]
+        assert names == ["first", "second", "url"]
+        assert validator.validate({"api": {"url": "https://example.com"}}) == []
+    
+    def test_validate_is_stateless_by_default(self):
+        """Test in-place edits are seen by the next validate call."""
+        config_data = {"database": {"port": 80}}
+        
+        validator = ConfigValidator()
+        validator.add_rule("database.port", "port")
+        assert validator.validate(config_data) == []
+        
+        config_data["database"]["port"] = 0
+        assert len(validator.validate(config_data)) == 1
+    
+    def test_validate_reuses_result_for_same_revision(self):
+        """Test results are reused only for an unchanged revision and rules."""
+        config_data = {"database": {"port": 99999}}
+        
+        validator = ConfigValidator()
+        validator.add_rule("database.port", "port")
+        
+        errors = validator.validate(config_data, revision=1)
+        assert len(errors) == 1
+        errors.clear()  # Callers get their own copy
+        
+        config_data["database"]["port"] = 5432
+        assert len(validator.validate(config_data, revision=1)) == 1
+        assert validator.validate(config_data, revision=2) == []
+        
+        validator.add_rule("database.host", "required")
+        assert len(validator.validate(config_data, revision=2)) == 1
+    
     def test_validate_key_specific(self):
         """Test validating specific key path."""
         config_data = {
@@ -267,6 +410,35 @@ class TestConfigValidator:
         assert len(good_errors) == 0
         assert len(bad_errors) == 1
     
+    def test_validate_key_missing_and_quoted_paths(self):
+        """Test validate_key with missing keys and quotes in key names."""
+        validator = ConfigValidator()
+        validator.add_rule("it's.\"port\"", "port")
+        validator.add_rule("server.port", "required")
+        
+        assert validator.validate_key("it's.\"port\"", {"it's": {'"port"': 0}}) == [
+            "it's.\"port\": must be a valid port number (1-65535) (value: 0)"
+        ]
+        assert validator.validate_key("server.port", {"server": "localhost"}) == [
+            "server.port: Required key is missing"
+        ]
+        assert validator.validate_key("server.port", {}) == [
+            "server.port: Required key is missing"
+        ]
+    
+    def test_validate_key_agrees_with_validate(self):
+        """Test validate_key resolves paths through dicts only, like validate."""
+        class Raising:
+            def __getitem__(self, key):
+                raise IndexError(key)
+        
+        validator = ConfigValidator()
+        validator.add_rule("db.port", "port")
+        
+        for config_data in ({"db": MappingProxyType({"port": 0})}, {"db": Raising()}):
+            assert validator.validate_key("db.port", config_data) == []
+            assert validator.validate(config_data) == []
+    
     def test_get_rules_for_key(self):
         """Test getting rules for a specific key."""
         validator = ConfigValidator()
@@ -348,6 +520,27 @@ class TestConfigValidator:
         
         errors = validator.validate(config_data)
         assert len(errors) == 4
+    
+    def test_range_rule_value_types(self):
+        """Test range rules accept convertible values and reject containers."""
+        validator = ConfigValidator()
+        validator.add_range_rule("ratio", 0, 1)
+        
+        assert validator.validate({"ratio": Decimal("0.5")}) == []
+        assert validator.validate({"ratio": "0.5"}) == []
+        assert len(validator.validate({"ratio": [0.5]})) == 1
+    
+    def test_choices_rule_unhashable_values(self):
+        """Test choices rules handle unhashable choices and values."""
+        validator = ConfigValidator()
+        validator.add_choices_rule("status", ["active", "inactive"])
+        validator.add_choices_rule("ports", [[80, 443], [8080]])
+        
+        config_data = {"status": ["active"], "ports": [8080]}
+        errors = validator.validate(config_data)
+        
+        assert len(errors) == 1
+        assert errors[0].startswith("status:")
 
 
 class TestBuiltInValidators:
@@ -368,6 +561,8 @@ class TestBuiltInValidators:
         assert url_rule.validate("http://") is False
         assert url_rule.validate("example.com") is False  # Missing scheme
         assert url_rule.validate("") is False
+        assert url_rule.validate("http://?query") is False  # Empty authority
+        assert url_rule.validate("http://exa mple.com") is False
     
     def test_port_validator(self):
         """Test port validation rule."""
@@ -386,6 +581,12 @@ class TestBuiltInValidators:
         assert port_rule.validate(65536) is False
         assert port_rule.validate(-1) is False
         assert port_rule.validate("not-a-port") is False
+        assert port_rule.validate(None) is False
+        assert port_rule.validate([80]) is False
+        
+        # Other convertible types are still accepted
+        assert port_rule.validate(Decimal(80)) is True
+        assert port_rule.validate(b"443") is True
         assert port_rule.validate("") is False
     
     def test_email_validator(self):
@@ -423,6 +624,13 @@ class TestBuiltInValidators:
         assert required_rule.validate("   ") is False  # Whitespace only
         assert required_rule.validate([]) is False
         assert required_rule.validate({}) is False
+        
+        # Values whose equality cannot be evaluated are still present
+        class NoEquality:
+            def __eq__(self, other):
+                raise TypeError("ambiguous comparison")
+        
+        assert required_rule.validate(NoEquality()) is True
 
 
 class TestConfigValidationError:
@@ -449,4 +657,11 @@ class TestConfigValidationError:
         exception = ConfigValidationError(errors)
         
         assert len(exception.errors) == 1
-        assert exception.errors[0] == "single.error: some validation message"
\ No newline at end of file
+        assert exception.errors[0] == "single.error: some validation message"
+    
+    def test_config_validation_error_pickle(self):
+        """Test ConfigValidationError survives pickling."""
+        exception = pickle.loads(pickle.dumps(ConfigValidationError(["a.b: bad"])))
+        
+        assert exception.errors == ["a.b: bad"]
+        assert "a.b: bad" in str(exception)
\ No newline at end of file